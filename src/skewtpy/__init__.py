@@ -1,8 +1,16 @@
-from .plotting import plot_skewt_logp, skew_transform
-from .wyoming import get_wyoming_sounding
+from .wyoming import get_wyoming_sounding, get_wyoming_soundings
 
 __all__ = [
     "plot_skewt_logp",
     "skew_transform",
     "get_wyoming_sounding",
-]
\ No newline at end of file
+    "get_wyoming_soundings",
+]
+
+
+def __getattr__(name):
+    # Plotting (and with it matplotlib) is loaded on first use only
+    if name in ("plot_skewt_logp", "skew_transform"):
+        from . import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
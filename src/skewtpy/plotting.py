@@ -1,5 +1,47 @@
+from functools import lru_cache
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+
+# Axis labels (pressure, temperature) per supported language
+_LABELS = {
+    "en": ("Pressure (hPa)", "Temperature (°C)"),
+    "es": ("Presión (hPa)", "Temperatura (°C)"),
+}
+
+# Publication-style spines and ticks, applied while the figure is built
+_SKEWT_STYLE = {
+    "axes.facecolor": "white",
+    "axes.linewidth": 1.1,
+    "xtick.direction": "out",
+    "xtick.major.size": 6,
+    "xtick.major.width": 1.0,
+    "xtick.minor.size": 3,
+    "xtick.minor.width": 0.8,
+    "ytick.direction": "out",
+    "ytick.major.size": 6,
+    "ytick.major.width": 1.0,
+    "ytick.minor.size": 3,
+    "ytick.minor.width": 0.8,
+}
+
+# Background isotherms (°C), emphasizing every 20°C
+_T0S = np.arange(-200, 80, 10)
+_MAJOR_MASK = _T0S % 20 == 0
+
+# Standard major pressure levels (NOAA-style)
+_P_MAJOR_ALL = np.array([1000, 925, 850, 700, 500, 400, 300, 250, 200, 150, 100])
+
+
+@lru_cache(maxsize=8)
+def _pressure_grid(p_ref):
+    """Pressure grid for the isotherms and its log, cached per p_ref."""
+    p_grid = np.linspace(p_ref, 50, 200)
+    logp_grid = np.log(p_grid)
+    # Shared between calls, so guard against in-place modification
+    p_grid.flags.writeable = False
+    logp_grid.flags.writeable = False
+    return p_grid, logp_grid
 
 
 def skew_transform(Tc, p_hPa, skew=-40):
@@ -22,7 +64,12 @@ def skew_transform(Tc, p_hPa, skew=-40):
     array-like
         Skewed x-coordinate values.
     """
-    return Tc + skew * np.log(p_hPa)
+    return _skew_from_logp(Tc, np.log(p_hPa), skew)
+
+
+def _skew_from_logp(Tc, logp, skew):
+    """Skew transform with ln(p) already computed by the caller."""
+    return Tc + skew * logp
 
 
 def plot_skewt_logp(T, Td, p, xlim_C=None, pmin=100, p_ref = 1025, lang='en', skew=-40):
@@ -42,109 +89,115 @@ def plot_skewt_logp(T, Td, p, xlim_C=None, pmin=100, p_ref = 1025, lang='en', sk
     pmin : float
         Minimum pressure (upper boundary) displayed (hPa).
     lang : str
-        Axis language ("en" or "es").
+        Axis language ("en" or "es"). Unknown values fall back to English.
     skew : float
         Skew factor controlling isotherm tilt.
     """
 
-    if lang == "en":
-        ylabel_name = "Pressure (hPa)"
-        xlabel_name = "Temperature (°C)"
-    if lang == "es":
-        ylabel_name = "Presión (hPa)"
-        xlabel_name = "Temperatura (°C)"
+    # Imported here so that fetching soundings never loads matplotlib
+    import matplotlib.patheffects as pe
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
-    fig, ax = plt.subplots(figsize=(7.5, 9))
+    ylabel_name, xlabel_name = _LABELS.get(lang, _LABELS["en"])
 
-    # Restrict calculations to visible pressure levels only
-    mask = p >= pmin
+    # Coerce once so every ufunc below takes the contiguous float64 path.
+    # Series lose pandas' NaN-skipping here, so reductions must be NaN-aware.
+    T = np.ascontiguousarray(T, dtype=np.float64)
+    p = np.ascontiguousarray(p, dtype=np.float64)
+    Td = None if Td is None else np.ascontiguousarray(Td, dtype=np.float64)
 
-    # --- Temperature profile ---
-    T_skew = skew_transform(T, p, skew=skew)
+    # Publication-style aesthetics (spines, ticks) come from _SKEWT_STYLE
+    with plt.rc_context(_SKEWT_STYLE):
+        fig, ax = plt.subplots(figsize=(7.5, 9))
 
-    # Black outline for publication-quality contrast
-    ax.plot(T_skew, p, linewidth=2.6, color="black", alpha=0.7, zorder=3)
-    ax.plot(T_skew, p, linewidth=1.6, color="red", zorder=4, label="T (°C)")
+        # Restrict calculations to visible pressure levels only
+        mask = p >= pmin
 
-    # Compute x-limits using only visible pressure range
-    Xmax = np.max(T_skew[mask])
-    Xmin = np.min(T_skew[mask])
+        # ln(p) is shared by the temperature and dewpoint profiles
+        logp = np.log(p)
 
-    # --- Dewpoint profile ---
-    if Td is not None:
-        Td_skew = skew_transform(Td, p, skew=skew)
+        # --- Temperature profile ---
+        T_skew = _skew_from_logp(T, logp, skew)
 
-        ax.plot(Td_skew, p, linewidth=2.2, color="black", ls="--", alpha=0.6, zorder=3)
-        ax.plot(Td_skew, p, linewidth=1.4, color="blue", ls="--", zorder=4, label="Td (°C)")
+        # Black outline for publication-quality contrast. The stroke shares the
+        # line's zorder, so where T and Td coincide the Td outline covers T.
+        ax.plot(
+            T_skew, p, linewidth=1.6, color="red", zorder=4, label="T (°C)",
+            path_effects=[pe.withStroke(linewidth=2.6, foreground="black", alpha=0.7)],
+        )
 
-        # Update limits including dewpoint
-        Xmin = min(Xmin, np.min(Td_skew[mask]))
-        Xmax = max(Xmax, np.max(Td_skew[mask]))
+        # Compute x-limits using only visible pressure range
+        # fmax/fmin skip NaN (missing levels are common in UWyo soundings)
+        Xmax = np.fmax.reduce(T_skew, where=mask, initial=-np.inf)
+        Xmin = np.fmin.reduce(T_skew, where=mask, initial=np.inf)
 
+        # --- Dewpoint profile ---
+        if Td is not None:
+            Td_skew = _skew_from_logp(Td, logp, skew)
 
-    # --- Background isotherms ---
-    T0s = np.arange(-200, 80, 10)
-    p_grid = np.linspace(p_ref, 50, 200)
+            ax.plot(
+                Td_skew, p, linewidth=1.4, color="blue", ls="--", zorder=4, label="Td (°C)",
+                path_effects=[pe.withStroke(linewidth=2.2, foreground="black", alpha=0.6)],
+            )
+
+            # Update limits including dewpoint
+            Xmin = min(Xmin, np.fmin.reduce(Td_skew, where=mask, initial=np.inf))
+            Xmax = max(Xmax, np.fmax.reduce(Td_skew, where=mask, initial=-np.inf))
+
+
+        # --- Background isotherms ---
+        p_grid, logp_grid = _pressure_grid(p_ref)
+
+        # One (n_isotherms, n_levels) array of skewed x-coordinates
+        X = _T0S[:, None] + skew * logp_grid[None, :]
+        segments = np.stack([X, np.broadcast_to(p_grid, X.shape)], axis=-1)
+
+        ax.add_collection(LineCollection(segments[_MAJOR_MASK], colors="0.3", linewidths=1.2, alpha=0.35, zorder=0))
+        ax.add_collection(LineCollection(segments[~_MAJOR_MASK], colors="0.3", linewidths=0.8, alpha=0.18, zorder=0))
+
+        # Highlight the 0°C isotherm
+        x0 = skew * logp_grid
+        ax.plot(x0, p_grid, color="0.2", linewidth=1.6, alpha=0.6, zorder=1)
+
+        # --- X-axis labeling referenced to surface pressure ---
+        x_ticks = _T0S + skew * np.log(p_ref)
+        ax.set_xticks(x_ticks)
+        ax.set_xticklabels(list(map(str, _T0S.tolist())))
+        ax.set_xlabel(xlabel_name)
+
+        # --- Logarithmic pressure axis ---
+        ax.set_yscale("log")
+        ax.set_ylim(p_ref, pmin)
+        ax.set_ylabel(ylabel_name)
+
+        p_major = _P_MAJOR_ALL[(_P_MAJOR_ALL <= p_ref) & (_P_MAJOR_ALL >= pmin)]
+        ax.set_yticks(p_major)
+        ax.set_yticklabels(list(map(str, p_major.astype(int).tolist())))
+
+        # Pressure gridlines with hierarchical emphasis
+        ax.grid(True, which="major", axis="y", linewidth=0.8, alpha=0.35)
+        ax.grid(True, which="minor", axis="y", linewidth=0.5, alpha=0.15)
+
+        # Set x-limits
+        if xlim_C is not None:
+            x_left  = skew_transform(xlim_C[0], p_ref, skew=skew)
+            x_right = skew_transform(xlim_C[1], p_ref, skew=skew)
+            ax.set_xlim(x_left, x_right)
+        else:
+            ax.set_xlim(Xmin - 10, Xmax + 10)
+
+        # Draw 1000 hPa baseline
+        ax.axhline(1000, color='black', linewidth=1.5, alpha=0.8, zorder=5)
+
+        legend = ax.legend(frameon=False, loc="upper right")
+
+        # Keep the legend samples as plain lines, without the profile outline
+        for line in legend.get_lines():
+            line.set_path_effects([])
+
+        plt.tight_layout()
 
-    for T0 in T0s:
-        x_line = skew_transform(T0 * np.ones_like(p_grid), p_grid, skew=skew)
-
-        # Emphasize every 20°C isotherm
-        lw = 1.2 if (T0 % 20 == 0) else 0.8
-        alpha = 0.35 if (T0 % 20 == 0) else 0.18
-
-        ax.plot(x_line, p_grid, color="0.3", linewidth=lw, alpha=alpha, zorder=0)
-
-    # Highlight the 0°C isotherm
-    x0 = skew_transform(0 * np.ones_like(p_grid), p_grid, skew=skew)
-    ax.plot(x0, p_grid, color="0.2", linewidth=1.6, alpha=0.6, zorder=1)
-
-    # --- X-axis labeling referenced to surface pressure ---
-    
-    x_ticks = skew_transform(T0s, p_ref * np.ones_like(T0s), skew=skew)
-    ax.set_xticks(x_ticks)
-    ax.set_xticklabels([f"{t:d}" for t in T0s])
-    ax.set_xlabel(xlabel_name)
-    
-    # --- Logarithmic pressure axis ---
-    ax.set_yscale("log")
-    ax.set_ylim(p_ref, pmin)
-    ax.set_ylabel(ylabel_name)
-    
-    # Standard major pressure levels (NOAA-style)
-    p_major = np.array([1000, 925, 850, 700, 500, 400, 300, 250, 200, 150, 100])
-    p_major = p_major[(p_major <= p_ref) & (p_major >= pmin)]
-    ax.set_yticks(p_major)
-    ax.set_yticklabels([f"{int(v)}" for v in p_major])
-
-    # Pressure gridlines with hierarchical emphasis
-    ax.grid(True, which="major", axis="y", linewidth=0.8, alpha=0.35)
-    ax.grid(True, which="minor", axis="y", linewidth=0.5, alpha=0.15)
-    
-
-    # Set x-limits
-    if xlim_C is not None:
-        x_left  = skew_transform(xlim_C[0], p_ref, skew=skew)
-        x_right = skew_transform(xlim_C[1], p_ref, skew=skew)
-        ax.set_xlim(x_left, x_right)
-    else:
-        ax.set_xlim(Xmin - 10, Xmax + 10)
-
-    # Draw 1000 hPa baseline
-    ax.axhline(1000, color='black', linewidth=1.5, alpha=0.8, zorder=5)
-
-    # --- Publication-style aesthetics ---
-    ax.set_facecolor("white")
-
-    for spine in ax.spines.values():
-        spine.set_linewidth(1.1)
-
-    ax.tick_params(axis="both", which="major", length=6, width=1.0, direction="out")
-    ax.tick_params(axis="both", which="minor", length=3, width=0.8, direction="out")
-
-    ax.legend(frameon=False, loc="upper right")
-
-    plt.tight_layout()
     plt.show()
     return fig
 
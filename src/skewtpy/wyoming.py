@@ -1,16 +1,111 @@
 import re
+import warnings
 import requests
+import numpy as np
 import pandas as pd
 from io import StringIO
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
-import re
-import requests
-import pandas as pd
-from io import StringIO
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+
+_DASH_RE = re.compile(r"^\s*-{5,}\s*$")
+_STOP_RE = re.compile(r"###|Station information|Observations")
+_BLANK_OR_DASH_RE = re.compile(r"^[ \t]*(?:-{5,}[ \t]*)?$", re.MULTILINE)
+
+# Soundings newer than this may still be revised, so they are not cached
+_CACHE_MIN_AGE = timedelta(days=2)
+
+
+def _is_valid_body(body: bytes) -> bool:
+    """Whether a raw UWyo response body holds a sounding rather than an error."""
+    if b"Can't get" in body or b"No data available" in body:
+        return False
+    return len(body.strip()) >= 200
+
+
+def _find_pre_block(body: bytes):
+    """Return the raw contents of the first <pre> block, or None if absent."""
+    # bytes.lower() keeps offsets, so positions found here index `body`
+    low = body.lower()
+
+    start = low.find(b"<pre")
+    if start == -1:
+        return None
+
+    start = low.find(b">", start)
+    if start == -1:
+        return None
+    start += 1
+
+    end = low.find(b"</pre>", start)
+    if end == -1:
+        return None
+
+    return body[start:end]
 
 
-def sounding_exists(url: str, timeout: int = 30):
+def _next_line(text: str, pos: int):
+    """Return the line starting at `pos` and the offset of the next line."""
+    end = text.find("\n", pos)
+    if end == -1:
+        return text[pos:], len(text)
+    return text[pos:end], end + 1
+
+
+def _is_cacheable(response) -> bool:
+    """requests_cache filter: keep only valid soundings old enough to be final."""
+    try:
+        query = parse_qs(urlparse(response.url).query)
+        ddhh = query["FROM"][0]
+        observed = datetime(
+            int(query["YEAR"][0]), int(query["MONTH"][0]),
+            int(ddhh[:2]), int(ddhh[2:]),
+            tzinfo=timezone.utc,
+        )
+    except (KeyError, ValueError):
+        return False
+
+    if datetime.now(timezone.utc) - observed < _CACHE_MIN_AGE:
+        return False
+
+    return _is_valid_body(response.content)
+
+
+def _new_session():
+    """
+    Create an HTTP session for UWyo requests.
+
+    When requests_cache is installed this is a CachedSession backed by a
+    SQLite file in the user cache directory, so past soundings are only
+    downloaded once. Otherwise it is a plain requests.Session.
+    """
+    if CachedSession is None:
+        return requests.Session()
+
+    return CachedSession(
+        "skewtpy",
+        backend="sqlite",
+        use_cache_dir=True,
+        expire_after=-1,
+        filter_fn=_is_cacheable,
+    )
+
+
+@lru_cache(maxsize=None)
+def _default_session():
+    """Module-wide session shared by calls that do not pass their own."""
+    return _new_session()
+
+
+def sounding_exists(url: str, timeout: int = 30, session=None):
     """
     Check whether a University of Wyoming sounding request returns valid data.
 
@@ -24,6 +119,10 @@ def sounding_exists(url: str, timeout: int = 30):
         Full University of Wyoming CGI URL for a TEXT:LIST sounding query.
     timeout : int, optional
         Timeout in seconds for the HTTP request (default is 30).
+    session : requests.Session or None, optional
+        Session used to issue the request. If None, a module-wide session
+        is used, which caches past soundings on disk when requests_cache
+        is installed.
 
     Returns
     -------
@@ -39,17 +138,16 @@ def sounding_exists(url: str, timeout: int = 30):
     markers returned by the UWyo server (e.g., "Can't get", "No data available"),
     and by checking for unusually short responses.
     """
-    try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
+    if session is None:
+        session = _default_session()
 
-        if "Can't get" in response.text or "No data available" in response.text:
-            return False, response
-
-        if len(response.text.strip()) < 200:
-            return False, response
+    try:
+        with session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            # Raw bytes: only the <pre> block is ever decoded
+            body = response.content
 
-        return True, response
+        return _is_valid_body(body), response
 
     except requests.RequestException:
         return False, None
@@ -63,6 +161,7 @@ def get_wyoming_sounding(
     station: int,
     region: str,
     header_idx: int = 2,
+    session=None,
 ):
     """
     Retrieve and parse a radiosonde sounding from the University of Wyoming archive.
@@ -98,12 +197,17 @@ def get_wyoming_sounding(
     header_idx : int, optional
         Zero-based index inside the <pre> block where the column names appear.
         Default is 2, which matches the standard UWyo TEXT:LIST format.
+    session : requests.Session or None, optional
+        Session used for the HTTP request. If None, a module-wide session
+        is used (see `sounding_exists`).
 
     Returns
     -------
     pandas.DataFrame
         DataFrame containing the sounding variables parsed from the fixed-width
-        table. Column names are inferred from the header line. Units are stored
+        table, with every column as float64 (missing or non-numeric values
+        are NaN).
+        Column names are inferred from the header line. Units are stored
         in `df.attrs["units"]` when available.
 
     Raises
@@ -119,7 +223,8 @@ def get_wyoming_sounding(
     2. Verifies that the sounding exists.
     3. Extracts the HTML <pre> block containing the ASCII table.
     4. Identifies the header and unit lines.
-    5. Parses the fixed-width table using pandas.read_fwf().
+    5. Parses the table with NumPy when every row is complete, falling back
+       to pandas.read_fwf() when some fields are blank.
     6. Removes trailing metadata after the data section.
 
     The returned DataFrame typically contains columns such as:
@@ -135,54 +240,130 @@ def get_wyoming_sounding(
         f"&FROM={ddhh}&TO={ddhh}&STNM={station}"
     )
 
-    exists, response = sounding_exists(url)
+    exists, response = sounding_exists(url, session=session)
 
     if not exists:
         raise ValueError("Sounding not available for this datetime/station.")
 
-    match = re.search(
-        r"<pre[^>]*>(.*?)</pre>",
-        response.text,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    pre_raw = _find_pre_block(response.content)
 
-    if not match:
+    if pre_raw is None:
         raise ValueError("No <pre> block found in response.")
 
-    pre_block = match.group(1)
-    lines = pre_block.splitlines()
+    pre_block = pre_raw.decode("ascii", errors="replace")
+
+    # Walk the leading lines by offset rather than splitting the whole block
+    pos = 0
+    for _ in range(header_idx):
+        _, pos = _next_line(pre_block, pos)
 
-    header_line = lines[header_idx].strip()
-    units_line = lines[header_idx + 1].strip() if header_idx + 1 < len(lines) else ""
+    header_line, pos = _next_line(pre_block, pos)
+    units_line, pos = _next_line(pre_block, pos)
+    header_line = header_line.strip()
+    units_line = units_line.strip()
 
-    data_start = header_idx + 2
+    if not header_line:
+        raise ValueError("No header line found in <pre> block.")
 
-    if data_start < len(lines) and re.match(r"^\s*-{5,}\s*$", lines[data_start]):
-        data_start += 1
+    line, after = _next_line(pre_block, pos)
+    if _DASH_RE.match(line):
+        pos = after
 
-    data_lines = lines[data_start:]
+    # Cut at the start of the first line holding a trailing-metadata marker
+    end = len(pre_block)
+    stop = _STOP_RE.search(pre_block, pos)
+    if stop is not None:
+        end = max(pre_block.rfind("\n", pos, stop.start()), pos)
 
-    stop_markers = ("###", "Station information", "Observations")
-    cut = None
-    for i, ln in enumerate(data_lines):
-        if any(mk in ln for mk in stop_markers):
-            cut = i
-            break
-    if cut is not None:
-        data_lines = data_lines[:cut]
+    data_text = pre_block[pos:end].strip()
 
-    data_lines = [
-        ln for ln in data_lines
-        if ln.strip() and not re.match(r"^\s*-{5,}\s*$", ln)
-    ]
+    # Blank or dash rows inside the table are rare; only then split lines
+    if _BLANK_OR_DASH_RE.search(data_text):
+        data_text = "\n".join(
+            ln for ln in data_text.splitlines()
+            if ln.strip() and not _DASH_RE.match(ln)
+        )
 
-    data_text = "\n".join(data_lines).strip()
     if not data_text:
         raise ValueError("No data rows found.")
 
     colnames = header_line.split()
 
-    df = pd.read_fwf(StringIO(data_text), header=None, names=colnames)
+    # Fast path: complete rows are plain whitespace-separated numbers.
+    # Rows with blank fields (common near the top of a sounding) can only
+    # be aligned by column position, so those go through read_fwf.
+    # On non-numeric tokens NumPy 2.x raises, while 1.x warns and returns a
+    # short array; both cases must end up on the read_fwf path.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring(data_text, dtype=np.float64, sep=" ")
+    except ValueError:
+        values = None
+
+    nrows = data_text.count("\n") + 1
+
+    if values is not None and values.size == nrows * len(colnames):
+        df = pd.DataFrame(values.reshape(nrows, len(colnames)), columns=colnames)
+    else:
+        df = pd.read_fwf(StringIO(data_text), header=None, names=colnames)
+        df = df.apply(pd.to_numeric, errors="coerce").astype(np.float64)
     df.attrs["units"] = units_line
 
     return df
+
+
+def get_wyoming_soundings(
+    datetimes,
+    station: int,
+    region: str,
+    header_idx: int = 2,
+    max_workers: int = 8,
+):
+    """
+    Retrieve several radiosonde soundings from the University of Wyoming archive.
+
+    Requests are issued concurrently over a shared ``requests.Session``, so
+    connections are reused instead of paying a new TCP/TLS handshake for
+    every sounding. Past soundings are served from the on-disk cache when
+    requests_cache is installed.
+
+    Parameters
+    ----------
+    datetimes : iterable of datetime.datetime
+        Sounding times (UTC). Only year, month, day and hour are used.
+    station : int
+        WMO station number (e.g., 76679).
+    region : str
+        University of Wyoming regional identifier (e.g., "naconf").
+        See `get_wyoming_sounding` for valid options.
+    header_idx : int, optional
+        Zero-based index inside the <pre> block where the column names appear.
+        Default is 2.
+    max_workers : int, optional
+        Maximum number of concurrent requests (default is 8).
+
+    Returns
+    -------
+    list of pandas.DataFrame or None
+        One entry per input datetime, in the same order. Entries are None
+        for soundings that are not available or could not be parsed.
+    """
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+
+    with _new_session() as session:
+        session.mount("https://", adapter)
+
+        def fetch(dt: datetime):
+            try:
+                return get_wyoming_sounding(
+                    dt.year, dt.month, dt.day, dt.hour,
+                    station, region,
+                    header_idx=header_idx,
+                    session=session,
+                )
+            except ValueError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, datetimes))
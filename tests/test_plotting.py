@@ -0,0 +1,44 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from skewtpy import plot_skewt_logp
+
+
+P = np.array([1000.0, 925.0, 850.0, 700.0, 500.0, 300.0])
+
+
+def _xlim(T, Td, p):
+    fig = plot_skewt_logp(T, Td, p)
+    xlim = fig.axes[0].get_xlim()
+    plt.close(fig)
+    return xlim
+
+
+def test_xlim_ignores_missing_temperature():
+    # Below-ground levels in UWyo frames carry NaN temperature
+    T = pd.Series([np.nan, np.nan, 12.0, 5.0, -10.0, -40.0])
+    T_skew = T.to_numpy() - 40 * np.log(P)
+
+    left, right = _xlim(T, None, pd.Series(P))
+
+    assert left == pytest.approx(np.nanmin(T_skew) - 10)
+    assert right == pytest.approx(np.nanmax(T_skew) + 10)
+
+
+def test_xlim_includes_dewpoint_with_missing_levels():
+    # Dewpoint is usually missing aloft
+    T = np.array([25.0, 20.0, 12.0, 5.0, -10.0, -40.0])
+    Td = np.array([20.0, 15.0, 8.0, -20.0, np.nan, np.nan])
+    T_skew = T - 40 * np.log(P)
+    Td_skew = Td - 40 * np.log(P)
+
+    left, right = _xlim(T, Td, P)
+
+    assert left == pytest.approx(min(np.nanmin(T_skew), np.nanmin(Td_skew)) - 10)
+    assert right == pytest.approx(max(np.nanmax(T_skew), np.nanmax(Td_skew)) + 10)
@@ -0,0 +1,163 @@
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pytest
+
+from skewtpy import get_wyoming_sounding, get_wyoming_soundings
+from skewtpy import wyoming
+
+
+RULE = "-" * 77
+
+TABLE_HEADER = [
+    "",
+    RULE,
+    "   PRES   HGHT   TEMP   DWPT   SKNT",
+    "    hPa     m      C      C   knot",
+    RULE,
+]
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.url = ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serve a fixed body for every URL, recording the requested URLs."""
+
+    def __init__(self, content):
+        self.content = content
+        self.urls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def body_for(self, url):
+        return self.content
+
+    def get(self, url, timeout=None, stream=False):
+        self.urls.append(url)
+        return FakeResponse(self.body_for(url))
+
+
+def make_page(rows, open_tag="pre", close_tag="pre"):
+    """Build a UWyo-like TEXT:LIST page around the given data rows."""
+    table = "\n".join(TABLE_HEADER + rows)
+    return (
+        "<html><head><title>University of Wyoming - Radiosonde Data</title></head>"
+        f"<body><h2>76679 MMMX Mexico City Observations at 12Z 01 Jun 2024</h2>"
+        f"<{open_tag}>{table}\n</{close_tag}>"
+        "<h3>Station information and sounding indices</h3>"
+        "<pre>Station number: 76679</pre></body></html>"
+    ).encode("ascii")
+
+
+def fetch(page):
+    return get_wyoming_sounding(2024, 6, 1, 12, 76679, "naconf", session=FakeSession(page))
+
+
+def test_complete_rows():
+    df = fetch(make_page([
+        " 1000.0    100   25.0   20.0     10",
+        "  925.0    800   20.0   15.0     15",
+        "  850.0   1500   12.0    8.0     20",
+    ]))
+
+    assert list(df.columns) == ["PRES", "HGHT", "TEMP", "DWPT", "SKNT"]
+    assert (df.dtypes == np.float64).all()
+    assert df["HGHT"].tolist() == [100.0, 800.0, 1500.0]
+    assert df.attrs["units"] == "hPa     m      C      C   knot"
+
+
+def test_blank_fields_use_fixed_width_columns():
+    df = fetch(make_page([
+        " 1000.0    100   25.0   20.0     10",
+        "  925.0    800   20.0   15.0     15",
+        "  850.0   1500   12.0            20",
+    ]))
+
+    assert (df.dtypes == np.float64).all()
+    assert np.isnan(df["DWPT"].iloc[2])
+    assert df["SKNT"].tolist() == [10.0, 15.0, 20.0]
+
+
+def test_non_numeric_token_falls_back_to_read_fwf():
+    df = fetch(make_page([
+        " 1000.0    100   25.0   20.0     10",
+        "  925.0    800   20.0    abc     15",
+        "  850.0   1500   12.0    8.0     20",
+    ]))
+
+    assert (df.dtypes == np.float64).all()
+    assert np.isnan(df["DWPT"].iloc[1])
+    assert df["TEMP"].tolist() == [25.0, 20.0, 12.0]
+
+
+@pytest.mark.parametrize("open_tag, close_tag", [
+    ("pre", "pre"),
+    ("PRE", "PRE"),
+    ("Pre", "pRE"),
+    ("pre", "PRE"),
+    ("PRE", "pre"),
+])
+def test_pre_block_tags_are_case_insensitive(open_tag, close_tag):
+    page = make_page([" 1000.0    100   25.0   20.0     10"], open_tag, close_tag)
+
+    df = fetch(page)
+
+    assert df["PRES"].tolist() == [1000.0]
+
+
+def test_unavailable_sounding_raises():
+    page = b"<html><body>Can't get 76679 MMMX Observations</body></html>" + b" " * 300
+
+    with pytest.raises(ValueError, match="not available"):
+        fetch(page)
+
+
+class DaySession(FakeSession):
+    """Serve a table whose surface height is the requested day, or an error page."""
+
+    def __init__(self, missing_days):
+        super().__init__(None)
+        self.missing_days = missing_days
+
+    def body_for(self, url):
+        day = int(parse_qs(urlparse(url).query)["FROM"][0][:2])
+        if day in self.missing_days:
+            return b"<html><body>Can't get 76679 MMMX Observations</body></html>" + b" " * 300
+        return make_page([f" 1000.0  {day:5d}   25.0   20.0     10"])
+
+
+def test_batched_soundings_keep_order_and_mark_missing(monkeypatch):
+    session = DaySession(missing_days={3, 7})
+    monkeypatch.setattr(wyoming, "_new_session", lambda: session)
+    dates = [datetime(2024, 6, day, 12) for day in range(1, 11)]
+
+    frames = get_wyoming_soundings(dates, 76679, "naconf", max_workers=4)
+
+    assert len(frames) == len(dates)
+    assert len(session.urls) == len(dates)
+    for dt, df in zip(dates, frames):
+        if dt.day in session.missing_days:
+            assert df is None
+        else:
+            assert df["HGHT"].tolist() == [float(dt.day)]